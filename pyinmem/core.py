@@ -7,7 +7,14 @@ from collections import defaultdict
 from typing import Any, Callable, Dict, Optional
 
 from .exceptions import OperationNotSupportedError, PyInMemStoreError
-from .strategy import ListStrategy, SetStrategy, SortedSetStrategy, StringStrategy
+from .strategy import (
+    ListStrategy,
+    SetStrategy,
+    SortedSetStrategy,
+    StringStrategy,
+    TimeSeriesStrategy,
+)
+from .strategy.string import decode_value, encode_value
 
 
 class PyInMemStore:
@@ -30,11 +37,13 @@ class PyInMemStore:
             target=self.active_expire_cycle, daemon=True
         )
         self.active_expire_thread.start()
+        self.string_strategy = StringStrategy()
         self.strategies: list = [
-            StringStrategy(),
+            self.string_strategy,
             ListStrategy(),
             SetStrategy(),
             SortedSetStrategy(),
+            TimeSeriesStrategy(),
         ]
         if file_data_path:
             self.save_data_file_path = file_data_path
@@ -55,23 +64,28 @@ class PyInMemStore:
 
         def method(key, *args, **kwargs):
             try:
-                current_value = self.store.get(key, None)
-
-                for strategy in self.strategies:
-                    if strategy.is_valid_type(current_value) or current_value is None:
-                        if hasattr(strategy, name):
-                            func = getattr(strategy, name)
-                            return self._with_key_lock(
-                                key, func, self.store, key, *args, **kwargs
-                            )
-
-                raise OperationNotSupportedError(
-                    f"Operation '{name}' is not supported for"
-                    f"the data type of key '{key}'"
-                )
+                return self._with_key_lock(key, dispatch, key, *args, **kwargs)
             except Exception as exc:
                 raise PyInMemStoreError(f"An error occurred: {exc!r}") from exc
 
+        def dispatch(key, *args, **kwargs):
+            # Runs under the key lock so the type check, the read and the
+            # write of an operation such as ``incr`` happen atomically.
+            if self._check_expiry(key):
+                self._delete_key_without_lock(key)
+            current_value = self.store.get(key, None)
+
+            for strategy in self.strategies:
+                if strategy.is_valid_type(current_value) or current_value is None:
+                    if hasattr(strategy, name):
+                        func = getattr(strategy, name)
+                        return func(self.store, key, *args, **kwargs)
+
+            raise OperationNotSupportedError(
+                f"Operation '{name}' is not supported for"
+                f"the data type of key '{key}'"
+            )
+
         return method
 
     def _get_lock(self, key: str) -> threading.Lock:
@@ -95,17 +109,74 @@ class PyInMemStore:
         return wrapper
 
     @with_key_lock
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set a value for a given key with an optional TTL (time-to-live)."""
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        nx: bool = False,
+        xx: bool = False,
+        ex: Optional[int] = None,
+        px: Optional[int] = None,
+    ) -> bool:
+        """
+        Set a value for a given key with an optional TTL (time-to-live).
+        ``nx`` only sets missing keys, ``xx`` only sets existing keys and
+        ``ex``/``px`` give the TTL in seconds/milliseconds.
+        Returns whether the value was set.
+        """
+        if nx and xx:
+            raise PyInMemStoreError("nx and xx options are mutually exclusive")
+        if sum(option is not None for option in (ttl, ex, px)) > 1:
+            raise PyInMemStoreError("only one of ttl, ex and px may be given")
+        if ex is not None:
+            ttl = ex
         if ttl:
             ttl = int(ttl)
-
-        self.store[key] = value
+        if px is not None:
+            ttl = int(px) / 1000
+
+        exists = self._exists(key)
+        if (nx and exists) or (xx and not exists):
+            return False
+        self._set(key, value, ttl)
+        return True
+
+    def _set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Internal method to store a value and its TTL for a key."""
+        self.store[key] = encode_value(value)
         if ttl is not None:
             self.ttl_keys[key] = time.time() + ttl
         else:
             self.ttl_keys.pop(key, None)
 
+    def _exists(self, key: str) -> bool:
+        """Check if a key exists, deleting it first if it has expired."""
+        if self._check_expiry(key):
+            self._delete_key_without_lock(key)
+        return key in self.store
+
+    @with_key_lock
+    def setnx(self, key: str, value: Any) -> bool:
+        """Set a value for a key only if the key does not exist."""
+        if self._exists(key):
+            return False
+        self._set(key, value)
+        return True
+
+    @with_key_lock
+    def getset(self, key: str, value: Any) -> Optional[Any]:
+        """Set a new value for a key and return its old value, clearing any TTL."""
+        old_value = self.store.get(key) if self._exists(key) else None
+        is_string = self.string_strategy.is_valid_type(old_value)
+        if old_value is not None and not is_string:
+            raise OperationNotSupportedError(
+                f"Operation 'getset' is not supported for "
+                f"the data type of key '{key}'"
+            )
+        self._set(key, value)
+        return decode_value(old_value)
+
     @with_key_lock
     def get(self, key: str) -> Optional[Any]:
         """
@@ -115,7 +186,7 @@ class PyInMemStore:
         if self._check_expiry(key):
             self._delete_key_without_lock(key)
             return None
-        return self.store.get(key, None)
+        return decode_value(self.store.get(key, None))
 
     @with_key_lock
     def delete(self, key: str) -> None:
@@ -205,7 +276,8 @@ class PyInMemStore:
     def _save_data(self) -> None:
         """Save data to the specified file."""
         with open(self.save_data_file_path, "w") as file:
-            data = {"store": self.store, "ttl_keys": self.ttl_keys}
+            store = {key: decode_value(value) for key, value in self.store.items()}
+            data = {"store": store, "ttl_keys": self.ttl_keys}
             json.dump(data, file)
 
     def _load_data(self) -> None:
@@ -215,7 +287,10 @@ class PyInMemStore:
         try:
             with open(self.save_data_file_path, "r", encoding="utf8") as file:
                 data = json.load(file)
-                self.store = data.get("store", {})
+                self.store = {
+                    key: encode_value(value)
+                    for key, value in data.get("store", {}).items()
+                }
                 self.ttl_keys = data.get("ttl_keys", {})
         except FileNotFoundError:
             logging.info(
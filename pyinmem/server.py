@@ -70,10 +70,18 @@ class PyInMemStoreServer:
             cmd, args = parts[0].upper(), parts[1:]
             logger.info("Processing command: %s, args: %s", cmd, args)
             if cmd == "SET":
-                self.store.set(*args)
-                return "OK"
+                set_args, set_kwargs = self.parse_set_args(args)
+                return "OK" if self.store.set(*set_args, **set_kwargs) else "None"
             elif cmd == "GET":
-                return self.store.get(args[0]) or "None"
+                return str(self.store.get(args[0]))
+            elif cmd == "SETNX":
+                return str(int(self.store.setnx(args[0], args[1])))
+            elif cmd == "GETSET":
+                return str(self.store.getset(args[0], args[1]))
+            elif cmd in ("INCR", "DECR"):
+                return str(getattr(self.store, cmd.lower())(args[0]))
+            elif cmd in ("INCRBY", "DECRBY", "INCRBYFLOAT", "APPEND"):
+                return str(getattr(self.store, cmd.lower())(args[0], args[1]))
             elif cmd == "DELETE":
                 self.store.delete(args[0])
                 return "OK"
@@ -87,6 +95,26 @@ class PyInMemStoreServer:
         except Exception as e:
             return f"ERROR: {e}"
 
+    @staticmethod
+    def parse_set_args(args):
+        """Translate `SET key value [NX|XX] [EX seconds|PX milliseconds]`."""
+        key, value, options = args[0], args[1], [arg.upper() for arg in args[2:]]
+        kwargs = {}
+        index = 0
+        while index < len(options):
+            option = options[index]
+            if option in ("NX", "XX"):
+                kwargs[option.lower()] = True
+            elif option in ("EX", "PX"):
+                kwargs[option.lower()] = int(args[2 + index + 1])
+                index += 1
+            elif index == 0 and option.isdigit():
+                kwargs["ttl"] = int(option)
+            else:
+                raise ValueError(f"Unknown SET option '{args[2 + index]}'")
+            index += 1
+        return (key, value), kwargs
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="PyInMemStore Server")
@@ -2,5 +2,12 @@ from .list import ListStrategy
 from .set import SetStrategy
 from .sorted_set import SortedSetStrategy
 from .string import StringStrategy
+from .time_series import TimeSeriesStrategy
 
-__all__ = ("ListStrategy", "SetStrategy", "SortedSetStrategy", "StringStrategy")
+__all__ = (
+    "ListStrategy",
+    "SetStrategy",
+    "SortedSetStrategy",
+    "StringStrategy",
+    "TimeSeriesStrategy",
+)
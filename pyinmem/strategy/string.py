@@ -1,11 +1,137 @@
-from typing import Any
+import math
+from decimal import Decimal
+from typing import Any, Dict, Union
 
+from ..exceptions import DataTypeError
 from .base import DataTypeStrategy
 
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+# Longest decimal representation of a 64-bit signed integer.
+MAX_INT_STRING_LENGTH = 20
+
+
+class EncodedInt(int):
+    """
+    An integer holding a numeric string. Stored in place of the string and
+    turned back into one by ``decode_value`` when read.
+    """
+
+    __slots__ = ()
+
+
+# Integers in this range are handed out from a single shared tuple, so counter
+# heavy keyspaces reference one object per value instead of one per key.
+SHARED_INTEGERS = 10000
+_shared_integers = tuple(EncodedInt(number) for number in range(SHARED_INTEGERS))
+
+
+def share_int(number: int) -> EncodedInt:
+    """Return the encoded form of an integer, shared for small values."""
+    if 0 <= number < SHARED_INTEGERS:
+        return _shared_integers[number]
+    return EncodedInt(number)
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Encode a string value as an ``EncodedInt`` when it is the canonical
+    decimal representation of a 64-bit integer, otherwise return it unchanged.
+    """
+    if isinstance(value, str) and 0 < len(value) <= MAX_INT_STRING_LENGTH:
+        try:
+            number = int(value)
+        except ValueError:
+            return value
+        if str(number) == value and INT64_MIN <= number <= INT64_MAX:
+            return share_int(number)
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    """Return the string an ``EncodedInt`` was stored for."""
+    if isinstance(value, EncodedInt):
+        return str(value)
+    return value
+
+
+def format_float(value: float) -> str:
+    """Format a float in plain decimal notation without trailing zeros."""
+    text = format(Decimal(repr(value)), "f")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return text
+
+
+def parse_int(value: Any, message: str) -> int:
+    """Convert an int or numeric string to an int, raising DataTypeError."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = encode_value(value)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise DataTypeError(message)
+    return int(value)
+
 
 class StringStrategy(DataTypeStrategy):
     """Strategy for handling string data types in PyInMemStore."""
 
     def is_valid_type(self, value: Any) -> bool:
-        """Check if the given value is a string."""
-        return isinstance(value, str)
+        """Check if the given value is a string or an encoded number."""
+        return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+    def incrby(self, store: Dict[str, Any], key: str, amount: int) -> int:
+        """Increment the integer at the given key by amount."""
+        amount = parse_int(amount, "increment is not an integer")
+        current = store.get(key)
+        value = 0
+        if current is not None:
+            value = parse_int(current, "value is not an integer")
+        value += amount
+        if not INT64_MIN <= value <= INT64_MAX:
+            raise DataTypeError("increment or decrement would overflow")
+        # Native ints stay native, anything else follows string semantics.
+        store[key] = value if type(current) is int else share_int(value)
+        return value
+
+    def incr(self, store: Dict[str, Any], key: str) -> int:
+        """Increment the integer at the given key by one."""
+        return self.incrby(store, key, 1)
+
+    def decrby(self, store: Dict[str, Any], key: str, amount: int) -> int:
+        """Decrement the integer at the given key by amount."""
+        amount = parse_int(amount, "decrement is not an integer")
+        return self.incrby(store, key, -amount)
+
+    def decr(self, store: Dict[str, Any], key: str) -> int:
+        """Decrement the integer at the given key by one."""
+        return self.incrby(store, key, -1)
+
+    def incrbyfloat(
+        self, store: Dict[str, Any], key: str, amount: Union[float, str]
+    ) -> float:
+        """Increment the number at the given key by a floating point amount."""
+        current = store.get(key)
+        try:
+            result = float(0 if current is None else current) + float(amount)
+        except (TypeError, ValueError) as exc:
+            raise DataTypeError("value is not a valid float") from exc
+        if not math.isfinite(result):
+            raise DataTypeError("increment would produce NaN or Infinity")
+        # Native numbers stay native, anything else is stored as a string.
+        if type(current) in (int, float):
+            store[key] = result
+        else:
+            store[key] = encode_value(format_float(result))
+        return result
+
+    def append(self, store: Dict[str, Any], key: str, value: str) -> int:
+        """
+        Append a value to the string at the given key,
+        returning the new length of the string.
+        """
+        current = store.get(key)
+        result = str(value) if current is None else f"{current}{value}"
+        store[key] = result
+        return len(result)
@@ -0,0 +1,268 @@
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..exceptions import DataTypeError
+from .base import DataTypeStrategy
+
+Sample = Tuple[int, float]
+
+# Bounds of the signed 64-bit integers held by the timestamp arrays.
+TIMESTAMP_MIN = -(2**63)
+TIMESTAMP_MAX = 2**63 - 1
+
+AGGREGATIONS: Dict[str, Callable[[array], float]] = {
+    "avg": lambda values: sum(values) / len(values),
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "count": len,
+}
+
+
+class TimeSeriesChunk:
+    """A fixed capacity block of samples stored in two typed arrays."""
+
+    __slots__ = ("timestamps", "values")
+
+    def __init__(self) -> None:
+        self.timestamps = array("q")
+        self.values = array("d")
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class TimeSeries:
+    """
+    An append-only series of (timestamp, value) samples split into chunks.
+    Timestamps are integer milliseconds and must not go backwards.
+    """
+
+    def __init__(self, retention: Optional[int] = None, chunk_size: int = 256):
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+            raise DataTypeError("chunk_size must be an integer")
+        if chunk_size <= 0:
+            raise DataTypeError("chunk_size must be positive")
+        if retention is not None:
+            if not isinstance(retention, int) or isinstance(retention, bool):
+                raise DataTypeError("retention must be an integer")
+            if retention < 0:
+                raise DataTypeError("retention must not be negative")
+        self.retention = retention
+        self.chunk_size = chunk_size
+        self.chunks: List[TimeSeriesChunk] = []
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks)
+
+    @property
+    def first_timestamp(self) -> Optional[int]:
+        return self.chunks[0].timestamps[0] if self.chunks else None
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return self.chunks[-1].timestamps[-1] if self.chunks else None
+
+    def add(self, timestamp: int, value: float) -> None:
+        """Append a sample, replacing the last one if the timestamp repeats."""
+        timestamp, value = int(timestamp), float(value)
+        if not TIMESTAMP_MIN <= timestamp <= TIMESTAMP_MAX:
+            raise DataTypeError(f"timestamp {timestamp} is out of range")
+        last = self.last_timestamp
+        if last is not None and timestamp < last:
+            raise DataTypeError(
+                f"timestamp {timestamp} is older than the last sample {last}"
+            )
+        if last == timestamp:
+            self.chunks[-1].values[-1] = value
+            return
+        if not self.chunks or len(self.chunks[-1]) >= self.chunk_size:
+            self.chunks.append(TimeSeriesChunk())
+        chunk = self.chunks[-1]
+        chunk.timestamps.append(timestamp)
+        chunk.values.append(value)
+
+    def trim(self) -> None:
+        """Drop whole chunks whose samples all fall outside the retention."""
+        if self.retention is None or not self.chunks:
+            return
+        cutoff = self.last_timestamp - self.retention
+        expired = 0
+        while (
+            expired < len(self.chunks) - 1
+            and self.chunks[expired].timestamps[-1] < cutoff
+        ):
+            expired += 1
+        if expired:
+            del self.chunks[:expired]
+
+    def range(self, start: Optional[int], end: Optional[int]) -> Tuple[array, array]:
+        """Return the timestamps and values within [start, end] as arrays."""
+        timestamps, values = array("q"), array("d")
+        if not self.chunks:
+            return timestamps, values
+        if self.retention is not None:
+            cutoff = self.last_timestamp - self.retention
+            start = cutoff if start is None else max(start, cutoff)
+
+        first = 0
+        if start is not None:
+            first = max(
+                bisect_right(self.chunks, start, key=lambda c: c.timestamps[0]) - 1, 0
+            )
+        for chunk in self.chunks[first:]:
+            chunk_timestamps = chunk.timestamps
+            if end is not None and chunk_timestamps[0] > end:
+                break
+            low = 0 if start is None else bisect_left(chunk_timestamps, start)
+            high = (
+                len(chunk_timestamps)
+                if end is None
+                else bisect_right(chunk_timestamps, end)
+            )
+            timestamps.extend(chunk_timestamps[low:high])
+            values.extend(chunk.values[low:high])
+        return timestamps, values
+
+
+class TimeSeriesStrategy(DataTypeStrategy):
+    """Strategy for handling time-series data types in PyInMemStore."""
+
+    def is_valid_type(self, value: Any) -> bool:
+        """Check if the given value is a time series."""
+        return isinstance(value, TimeSeries)
+
+    def ensure_time_series(
+        self, store: Dict[str, Any], key: str, retention: Optional[int] = None
+    ) -> TimeSeries:
+        """
+        Ensure the value for the given key is a time series in the store.
+        ``retention`` only applies when a new series is created.
+        """
+        if key not in store or not isinstance(store[key], TimeSeries):
+            store[key] = TimeSeries(retention=retention)
+        return store[key]
+
+    def tscreate(
+        self,
+        store: Dict[str, Any],
+        key: str,
+        retention: Optional[int] = None,
+        chunk_size: int = 256,
+    ) -> None:
+        """
+        Create an empty time series at the given key. Samples older than
+        ``retention`` milliseconds are dropped a chunk at a time.
+        """
+        if isinstance(store.get(key), TimeSeries):
+            raise DataTypeError(f"Time series '{key}' already exists")
+        store[key] = TimeSeries(retention=retention, chunk_size=chunk_size)
+
+    def tsadd(
+        self,
+        store: Dict[str, Any],
+        key: str,
+        timestamp: Optional[int],
+        value: float,
+        retention: Optional[int] = None,
+    ) -> int:
+        """
+        Add a sample to the time series at the given key. A ``None``
+        timestamp uses the current time in milliseconds. ``retention`` is
+        only used when the series does not exist yet.
+        """
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        timestamp, value = int(timestamp), float(value)
+        if not TIMESTAMP_MIN <= timestamp <= TIMESTAMP_MAX:
+            raise DataTypeError(f"timestamp {timestamp} is out of range")
+        series = self.ensure_time_series(store, key, retention)
+        series.add(timestamp, value)
+        series.trim()
+        return int(timestamp)
+
+    def tsmadd(
+        self,
+        store: Dict[str, Any],
+        key: str,
+        samples: Iterable[Sample],
+        retention: Optional[int] = None,
+    ) -> int:
+        """
+        Add many (timestamp, value) samples to the time series at the given key.
+        The batch is converted and validated first, and nothing is stored if
+        any sample is invalid or goes backwards. ``retention`` is only used
+        when the series does not exist yet.
+        """
+        timestamps, values = array("q"), array("d")
+        try:
+            for timestamp, value in samples:
+                timestamps.append(int(timestamp))
+                values.append(float(value))
+        except (OverflowError, TypeError, ValueError) as exc:
+            raise DataTypeError(f"invalid sample: {exc}") from exc
+        series = store.get(key)
+        last = series.last_timestamp if isinstance(series, TimeSeries) else None
+        for timestamp in timestamps:
+            if last is not None and timestamp < last:
+                raise DataTypeError(
+                    f"timestamp {timestamp} is older than the last sample {last}"
+                )
+            last = timestamp
+        series = self.ensure_time_series(store, key, retention)
+        for timestamp, value in zip(timestamps, values):
+            series.add(timestamp, value)
+        series.trim()
+        return len(timestamps)
+
+    def tsrange(
+        self,
+        store: Dict[str, Any],
+        key: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        aggregation: Optional[str] = None,
+        bucket_size: Optional[int] = None,
+    ) -> List[Sample]:
+        """
+        Return the samples between ``start`` and ``end`` inclusive. With an
+        ``aggregation`` (avg, min, max, sum or count) the samples are
+        downsampled into buckets of ``bucket_size`` milliseconds.
+        """
+        series = store.get(key)
+        if not isinstance(series, TimeSeries):
+            return []
+        timestamps, values = series.range(start, end)
+        if aggregation is None:
+            return list(zip(timestamps, values))
+
+        aggregate = AGGREGATIONS.get(aggregation.lower())
+        if aggregate is None:
+            raise DataTypeError(f"Unknown aggregation '{aggregation}'")
+        if not bucket_size or bucket_size <= 0:
+            raise DataTypeError("bucket_size must be positive")
+
+        result: List[Sample] = []
+        index, total = 0, len(timestamps)
+        while index < total:
+            bucket = timestamps[index] - timestamps[index] % bucket_size
+            bucket_end = bisect_left(timestamps, bucket + bucket_size, index)
+            result.append((bucket, aggregate(values[index:bucket_end])))
+            index = bucket_end
+        return result
+
+    def tsinfo(self, store: Dict[str, Any], key: str) -> Optional[Dict[str, Any]]:
+        """Return summary information about the time series at the given key."""
+        series = store.get(key)
+        if not isinstance(series, TimeSeries):
+            return None
+        return {
+            "total_samples": len(series),
+            "first_timestamp": series.first_timestamp,
+            "last_timestamp": series.last_timestamp,
+            "retention": series.retention,
+            "chunk_count": len(series.chunks),
+            "chunk_size": series.chunk_size,
+        }
@@ -1,9 +1,13 @@
 import json
 import os
+import threading
 import time
 from collections import deque
 
+import pytest
+
 from pyinmem.core import PyInMemStore
+from pyinmem.exceptions import OperationNotSupportedError, PyInMemStoreError
 from pyinmem.strategy import SortedSetStrategy
 
 
@@ -147,3 +151,222 @@ def test_save_and_load_data(tmp_path):
 
     # Optionally, clean up the test file if desired
     os.remove(test_file)
+
+
+def test_counter_operations():
+    store = PyInMemStore()
+    key = "counter"
+
+    assert store.incr(key) == 1
+    assert store.incrby(key, 10) == 11
+    assert store.decr(key) == 10
+    assert store.decrby(key, 4) == 6
+    assert store.incrbyfloat(key, 0.5) == 6.5
+    assert store.get(key) == "6.5"
+    assert store.incrbyfloat(key, 0.5) == 7.0
+    assert store.get(key) == "7"
+    assert store.incr(key) == 8
+    assert store.get(key) == "8"
+
+    store.set(key, "abc")
+    with pytest.raises(PyInMemStoreError):
+        store.incr(key)
+
+    store.lpush("list_key", "item")
+    with pytest.raises(PyInMemStoreError):
+        store.incr("list_key")
+
+
+def test_counter_keeps_ttl():
+    store = PyInMemStore()
+    key = "rate_limit"
+
+    store.set(key, "0", ex=10)
+    assert store.incr(key) == 1
+    assert 0 < store.ttl(key) <= 10
+
+
+def test_numeric_strings_are_encoded_as_shared_ints():
+    store = PyInMemStore()
+
+    store.set("a", "5000")
+    store.set("b", "5000")
+    assert store.get("a") == "5000"
+    assert store.store["a"] == 5000
+    assert store.store["a"] is store.store["b"]
+    assert store.getset("a", "1") == "5000"
+
+    store.set("c", "007")
+    assert store.get("c") == "007"
+
+    store.set("d", 5)
+    assert store.incr("d") == 6
+    assert store.get("d") == 6
+
+    assert store.incr("e") == 1
+    assert store.get("e") == "1"
+
+
+def test_counter_overflow():
+    store = PyInMemStore()
+
+    store.set("big", str(2**63 - 1))
+    with pytest.raises(PyInMemStoreError):
+        store.incr("big")
+    assert store.get("big") == str(2**63 - 1)
+
+    store.set("huge", "99999999999999999999")
+    with pytest.raises(PyInMemStoreError):
+        store.incr("huge")
+
+
+def test_concurrent_incr():
+    store = PyInMemStore()
+    key = "concurrent_counter"
+    threads_count, increments = 8, 1000
+
+    def worker():
+        for _ in range(increments):
+            store.incr(key)
+
+    threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.get(key) == str(threads_count * increments)
+
+
+def test_append_getset_setnx():
+    store = PyInMemStore()
+    key = "string_key"
+
+    assert store.append(key, "hello") == 5
+    assert store.append(key, " world") == 11
+    assert store.get(key) == "hello world"
+
+    assert store.setnx(key, "other") is False
+    assert store.setnx("new_key", "value") is True
+
+    store.set(key, "old", ttl=10)
+    assert store.getset(key, "new") == "old"
+    assert store.get(key) == "new"
+    assert store.ttl(key) == -1
+
+    store.lpush("list_key", "item")
+    with pytest.raises(OperationNotSupportedError):
+        store.getset("list_key", "value")
+    assert store.llen("list_key") == 1
+
+
+def test_set_options():
+    store = PyInMemStore()
+    key = "options_key"
+
+    assert store.set(key, "value", xx=True) is False
+    assert store.get(key) is None
+    assert store.set(key, "value", nx=True) is True
+    assert store.set(key, "other", nx=True) is False
+    assert store.get(key) == "value"
+    assert store.set(key, "other", xx=True, px=1500) is True
+    assert store.ttl(key) in (0, 1)
+
+    with pytest.raises(PyInMemStoreError):
+        store.set(key, "value", nx=True, xx=True)
+
+
+def test_time_series_operations():
+    store = PyInMemStore()
+    key = "cpu"
+
+    assert store.tsadd(key, 1000, 1.0) == 1000
+    assert store.tsmadd(key, [(1500, 3.0), (2000, 5.0), (2500, 7.0)]) == 3
+    assert store.tsrange(key) == [(1000, 1.0), (1500, 3.0), (2000, 5.0), (2500, 7.0)]
+    assert store.tsrange(key, 1500, 2000) == [(1500, 3.0), (2000, 5.0)]
+
+    assert store.tsrange(key, aggregation="avg", bucket_size=1000) == [
+        (1000, 2.0),
+        (2000, 6.0),
+    ]
+    assert store.tsrange(key, aggregation="max", bucket_size=1000) == [
+        (1000, 3.0),
+        (2000, 7.0),
+    ]
+    assert store.tsrange(key, 0, 1999, aggregation="count", bucket_size=1000) == [
+        (1000, 2)
+    ]
+
+    with pytest.raises(PyInMemStoreError):
+        store.tsadd(key, 500, 1.0)
+
+
+def test_time_series_retention_trims_chunks():
+    store = PyInMemStore()
+    key = "requests"
+
+    store.tscreate(key, retention=100, chunk_size=10)
+    store.tsmadd(key, [(timestamp, 1.0) for timestamp in range(0, 300, 5)])
+
+    info = store.tsinfo(key)
+    assert info["chunk_count"] == 3
+    assert info["first_timestamp"] == 150
+    assert info["last_timestamp"] == 295
+    assert store.tsrange(key)[0] == (195, 1.0)
+
+
+def test_time_series_create_keeps_existing_series():
+    store = PyInMemStore()
+    key = "existing"
+
+    store.tsadd(key, 1000, 1.0)
+    with pytest.raises(PyInMemStoreError):
+        store.tscreate(key, retention=5)
+    assert store.tsinfo(key)["total_samples"] == 1
+
+
+def test_time_series_madd_rejects_out_of_order_batch():
+    store = PyInMemStore()
+    key = "batch"
+
+    with pytest.raises(PyInMemStoreError):
+        store.tsmadd(key, [(10, 1), (20, 2), (5, 3)])
+    assert store.tsinfo(key) is None
+
+    store.tsadd(key, 30, 1.0)
+    with pytest.raises(PyInMemStoreError):
+        store.tsmadd(key, [(25, 1), (40, 2)])
+    assert store.tsrange(key) == [(30, 1.0)]
+
+    with pytest.raises(PyInMemStoreError):
+        store.tsmadd("overflow", [(1, 1), (2**64, 2)])
+    assert store.tsinfo("overflow") is None
+
+    with pytest.raises(PyInMemStoreError):
+        store.tsadd("overflow", 2**64, 1.0)
+    assert store.tsinfo("overflow") is None
+
+
+def test_time_series_validates_options():
+    store = PyInMemStore()
+
+    with pytest.raises(PyInMemStoreError):
+        store.tsmadd("negative", [(1, 1.0)], retention=-5)
+    assert store.tsinfo("negative") is None
+
+    with pytest.raises(PyInMemStoreError):
+        store.tscreate("chunks", chunk_size="5")
+    with pytest.raises(PyInMemStoreError):
+        store.tscreate("retention", retention=1.5)
+
+
+def test_time_series_retention_only_applies_on_create():
+    store = PyInMemStore()
+    key = "configured"
+
+    store.tscreate(key, retention=1000)
+    store.tsadd(key, 100, 1.0, retention=0)
+    store.tsmadd(key, [(200, 2.0)], retention=0)
+
+    assert store.tsinfo(key)["retention"] == 1000
+    assert store.tsrange(key) == [(100, 1.0), (200, 2.0)]